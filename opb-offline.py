@@ -1,4 +1,5 @@
 import argparse
+import functools
 import json
 import os
 import re
@@ -6,11 +7,47 @@ import shutil
 import subprocess
 import sys
 import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from html import unescape
+from typing import List, Tuple
 
-import requests
 import bs4
+import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
 from retry import retry
+from urllib3.util.retry import Retry
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import DownloadError
+
+# number of pages fetched concurrently by each thread pool
+MAX_WORKERS = 8
+
+_RE_SEASON = re.compile(r'Season (\d{1,3})')
+# episode metadata, in order of precedence: an episode number anywhere, else an air date anywhere, else the first
+# word of a group name. The first two are lookaheads anchored at the start, so they take priority over the group
+# name even when it appears earlier in the text.
+_RE_INFO = re.compile(r'^(?=.*?S\d{1,2} Ep(?P<ep>\d{1,4})(?: \| |\n))'
+                      r'|^(?=.*? (?P<date>\d{2}/\d{2}/\d{4}) )'
+                      r'|(?P<group>\w+)(?: \| |\n)', re.DOTALL)
+_RE_VID_ID = re.compile(rb"id: '(\d+)',")
+_RE_ERR = re.compile(rb'<p\b[^>]*\bclass=["\'](?:[^"\']*\s)?error-message(?:\s[^"\']*)?["\'][^>]*>\s*([^<]+?)\s*<')
+_RE_CTXBRIDGE = re.compile(rb'window\.contextBridge.*?"encodings":\s*\[\s*"https://urs\.pbs\.org/redirect/(\w+)/',
+                           re.DOTALL)
+_JSONP_CALLBACK = b'__whatever('
+_RE_CATALOG_ITEM = re.compile(rb'<div[^>]*\bclass=["\'](?:[^"\']*\s)?video-catalog__item["\'\s]')
+_RE_DOTS = re.compile(r'\.+')
+
+# characters replaced with dots, or removed, when normalizing episode titles for filenames
+_TITLE_TBL = str.maketrans({' ': '.', '/': '.', '\\': '.', '-': '.', '|': '.',
+                            ';': '', ',': '', "'": '', '"': '', '?': '', ':': ''})
+
+# the only parts of a season catalog page that are used; everything else is skipped while parsing
+_CATALOG_CLASSES = {'breadcrumbs__link', 'video-catalog__title', 'video-catalog__item'}
+_CATALOG_STRAINER = bs4.SoupStrainer(['a', 'h1', 'div'],
+                                     class_=lambda classes: classes is not None
+                                     and not _CATALOG_CLASSES.isdisjoint(classes.split()))
 
 
 class VideoError(Exception):
@@ -25,6 +62,38 @@ class ShowDoesNotExistError(Exception):
         super().__init__(self.error_msg)
 
 
+def parse_html(content: bytes, parse_only: bs4.SoupStrainer = None) -> bs4.BeautifulSoup:
+    """Parse an HTML page, preferring the lxml parser and falling back to html5lib if it is unavailable. If a
+    strainer is given, only the matching elements (and their descendants) are built"""
+
+    try:
+        return bs4.BeautifulSoup(content, 'lxml', from_encoding='utf-8', parse_only=parse_only)
+    except bs4.FeatureNotFound:
+        return bs4.BeautifulSoup(content, 'html5lib', from_encoding='utf-8', parse_only=parse_only)
+
+
+def is_cacheable(response: requests.Response) -> bool:
+    """Don't cache PBS player pages showing an error, as the video may become available later"""
+
+    return 'player.pbs.org' not in response.url or not _RE_ERR.search(response.content)
+
+
+def create_session() -> requests_cache.CachedSession:
+    """Create the shared session, which reuses connections and caches fetched pages on disk between runs"""
+
+    session = requests_cache.CachedSession('.opb_cache', backend='sqlite', expire_after=86400,
+                                           allowable_methods=('GET',), filter_fn=is_cacheable,
+                                           urls_expire_after={'watch.opb.org/show/*/episodes/*': 3600,
+                                                              'watch.opb.org/show/*/specials/*': 3600,
+                                                              'urs.pbs.org': requests_cache.DO_NOT_CACHE})
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                          max_retries=Retry(total=3, backoff_factor=0.3,
+                                                            status_forcelist=[502, 503, 504])))
+    session.headers['User-Agent'] = 'opb-offline'
+
+    return session
+
+
 class Show:
     def __init__(self, show_key: str):
         self.show_key = show_key
@@ -35,26 +104,26 @@ class Show:
 
     def _populate(self):
         url = f'https://watch.opb.org/show/{self.show_key}/episodes/'
-        html = requests.get(url)
+        html = SESSION.get(url)
 
         if html.status_code == 404:
             raise ShowDoesNotExistError(self.show_key)
 
-        page = bs4.BeautifulSoup(html.content, 'html5lib')
+        # only build a tree if the page looks like it has a season selector
+        season_select = None
+        if b'data-content-type=' in html.content:
+            season_select = parse_html(html.content).find('select', attrs={'data-content-type': 'episodes'})
 
-        if page.find('select', attrs={'data-content-type': 'episodes'}):
-            for curr_season in page.find('select', attrs={'data-content-type': 'episodes'}).find_all('option'):
+        if season_select:
+            for curr_season in season_select.find_all('option'):
                 self.seasons.insert(0, int(curr_season['value']))
         else:
             self.seasons.append(1)
 
         url = f'https://watch.opb.org/show/{self.show_key}/specials/'
-        html = requests.get(url)
-
-        page = bs4.BeautifulSoup(html.content, 'html5lib')
+        html = SESSION.get(url)
 
-        if page.find('div', class_='video-catalog__item'):
-            self.has_specials = True
+        self.has_specials = bool(_RE_CATALOG_ITEM.search(html.content))
 
 
 class Season:
@@ -67,20 +136,20 @@ class Season:
         self._populate()
 
     def _populate(self):
-        html = requests.get(self.url, allow_redirects=False)
+        html = SESSION.get(self.url, allow_redirects=False)
 
         if html.status_code == 302:
             raise VideoError(f'Season does not exist')
 
-        page = bs4.BeautifulSoup(html.content, 'html5lib')
+        page = parse_html(html.content, parse_only=_CATALOG_STRAINER)
 
         self.title = str(page.find('a', class_='breadcrumbs__link').contents[0])
 
         season_text = str(page.find('h1', class_='video-catalog__title').contents[0]).strip()
 
         # parse out the season number, unless it's a non-season group
-        if re.search(r'Season (\d{1,3})', season_text):
-            self.num = int(re.search(r'Season (\d{1,3})', season_text).group(1))
+        if match := _RE_SEASON.search(season_text):
+            self.num = int(match.group(1))
         else:
             self.additional_group = season_text
 
@@ -90,35 +159,37 @@ class Season:
             episode_title = str(episode.find('a', class_='video-summary__video-title-link').contents[0]).strip()
 
             info = episode.find('p', class_='video-summary__meta-data').contents[0]
+            episode_num = None
             date = None
             additional_group = None
 
-            # hack for erroneously prepended season numbers
-            if re.search(r'S(\d{1,2}) Ep(\d{1,2}) \| ', info):
-                episode_num = int(re.search(r'S(\d{1,2}) Ep(\d{1,2}) \| ', info).group(2))
-            elif re.search(r'S(\d{1,2}) Ep(\d{3,4})(( \| )|\n)', info):
-                episode_num = int(re.search(r'S(\d{1,2}) Ep(\d{3,4})(( \| )|\n)', info).group(2)[-2:])
-            elif re.search(r' (\d{2}/\d{2}/\d{4}) ', info):  # No episode number, but an original air date
-                episode_num = None
-                date = datetime.strptime(re.search(r' (\d{2}/\d{2}/\d{4}) ', info).group(1), '%m/%d/%Y')
+            match = _RE_INFO.search(info)
+            if match.lastgroup == 'ep':
+                # hack for erroneously prepended season numbers, e.g. Ep103 for episode 3
+                episode_num = int(match.group('ep')[-2:])
+            elif match.lastgroup == 'date':  # No episode number, but an original air date
+                date = datetime.strptime(match.group('date'), '%m/%d/%Y')
             else:
-                episode_num = None
-                additional_group = re.search(r'(\w+)(( \| )|\n)', info).group(1)
+                additional_group = match.group('group')
 
             episode = Episode(self, episode_title, url, episode_num, date, additional_group)
             self.episodes.append(episode)
 
-        self.episodes = sorted(self.episodes)
+        # non-season groups are listed without episode numbers, so keep the page order
+        if self.num is not None:
+            self.episodes.sort(key=lambda e: (e.num is None, e.num or 0))
 
-    def get_normalized_name(self) -> str:
+    @functools.cached_property
+    def normalized_name(self) -> str:
         return self.title.replace(' ', '.').replace(';', '')
 
-    def get_folder_name(self) -> str:
+    @functools.cached_property
+    def folder_name(self) -> str:
         group = f'-{GROUP}' if GROUP else ''
         if self.num:
-            return f'{self.get_normalized_name()}.S{self.num:02d}.WEB.h264.AAC{group}'
+            return f'{self.normalized_name}.S{self.num:02d}.WEB.h264.AAC{group}'
         else:
-            return f'{self.get_normalized_name()}.{self.additional_group}.WEB.h264.AAC{group}'
+            return f'{self.normalized_name}.{self.additional_group}.WEB.h264.AAC{group}'
 
 
 class Episode:
@@ -135,141 +206,130 @@ class Episode:
         self.audio_codec = None
 
     def get_video_url(self) -> str:
-        html = requests.get(self.url)
-        soup = bs4.BeautifulSoup(html.content, 'html5lib')
+        html = SESSION.get(self.url)
+        if not (match := _RE_VID_ID.search(html.content)):
+            raise VideoError('Video ID not found')
 
-        inline_script = str(soup.find('script', type='text/javascript'))
-        video_id = int(re.search(r"id: '(\d*)',", inline_script).group(1))
+        video_id = int(match.group(1))
 
         url_1 = f'https://player.pbs.org/stationplayer/{video_id}/?callsign=KOPB' \
                 f'&parentURL={urllib.parse.quote_plus(self.url)}' \
                 f'&unsafeDisableUpsellHref=true&unsafePostMessages=true'
 
-        page = requests.get(url_1)
-        soup = bs4.BeautifulSoup(page.content, 'html5lib')
+        page = SESSION.get(url_1)
 
-        if soup.find('p', class_='error-message'):
-            raise VideoError(str(soup.find('p', class_='error-message').contents[0]).strip())
+        if match := _RE_ERR.search(page.content):
+            raise VideoError(unescape(match.group(1).decode()))
 
-        script = soup.find_all('script', type=None, src=None,
-                               text=lambda t: t and 'window.contextBridge' in t)[0].contents[0]
-        if not re.search(r'"encodings": \["https://urs.pbs.org/redirect/(\w*)/"', script):
+        if not (match := _RE_CTXBRIDGE.search(page.content)):
             raise VideoError('Video redirect token not found')
 
-        redirect_token = re.search(r'"encodings": \["https://urs.pbs.org/redirect/(\w*)/"', script).group(1)
+        redirect_token = match.group(1).decode()
 
         url_2 = f'https://urs.pbs.org/redirect/{redirect_token}/?format=jsonp&callback=__whatever'
 
-        page = requests.get(url_2)
-        video_url = json.loads(re.search(r'__whatever\((.*)\)', str(page.content)).group(1))['url']
+        page = SESSION.get(url_2)
+        jsonp = page.content
+        start = jsonp.index(_JSONP_CALLBACK) + len(_JSONP_CALLBACK)
+        video_url = json.loads(jsonp[start:jsonp.rindex(b')')])['url']
 
         return video_url
 
-    def get_normalized_title(self) -> str:
-        dotted_episode_title = self.title.replace(' ', '.').replace(';', '').replace(',', '').replace('/', '.')\
-            .replace('\\', '.').replace("'", '').replace('"', '').replace('-', '.').replace('?', '').replace(':', '')\
-            .replace('|', '.')
-        return re.sub(r'\.+', '.', dotted_episode_title)
+    @functools.cached_property
+    def normalized_title(self) -> str:
+        return _RE_DOTS.sub('.', self.title.translate(_TITLE_TBL))
 
     def get_filename(self) -> str:
         group = f'-{GROUP}' if GROUP else ''
         if self.season.num and self.num:
-            return f'{self.season.get_normalized_name()}.S{self.season.num:02d}E{self.num:02d}.' \
-                   f'{self.get_normalized_title()}.{self.resolution}p.WEB.{self.video_codec}.{self.audio_codec}.' \
+            return f'{self.season.normalized_name}.S{self.season.num:02d}E{self.num:02d}.' \
+                   f'{self.normalized_title}.{self.resolution}p.WEB.{self.video_codec}.{self.audio_codec}.' \
                    f'{self.audio_channels}{group}.mp4'
         elif self.season.num and self.date:
             date_str = datetime.strftime(self.date, '%Y-%m-%d')
-            return f'{self.season.get_normalized_name()}.S{self.season.num:02d}.{date_str}.' \
-                   f'{self.get_normalized_title()}.{self.resolution}p.WEB.{self.video_codec}.{self.audio_codec}.' \
+            return f'{self.season.normalized_name}.S{self.season.num:02d}.{date_str}.' \
+                   f'{self.normalized_title}.{self.resolution}p.WEB.{self.video_codec}.{self.audio_codec}.' \
                    f'{self.audio_channels}{group}.mp4'
         else:
-            return f'{self.season.get_normalized_name()}.{self.additional_group}.' \
-                   f'{self.get_normalized_title()}.{self.resolution}p.WEB.{self.video_codec}.{self.audio_codec}.' \
+            return f'{self.season.normalized_name}.{self.additional_group}.' \
+                   f'{self.normalized_title}.{self.resolution}p.WEB.{self.video_codec}.{self.audio_codec}.' \
                    f'{self.audio_channels}{group}.mp4'
 
-    def get_dupe_check_regex(self) -> str:
+    @functools.cached_property
+    def dupe_check_regex(self) -> str:
         group = f'-{GROUP}' if GROUP else ''
         if self.season.num and self.num:
-            return f'{self.season.get_normalized_name()}.S{self.season.num:02d}E{self.num:02d}.' \
-                   f'{self.get_normalized_title()}.' + r'\d{2,4}' + r'p.WEB.\w+.\w+.\d.\d' + f'{group}.mp4'
+            return f'{self.season.normalized_name}.S{self.season.num:02d}E{self.num:02d}.' \
+                   f'{self.normalized_title}.' + r'\d{2,4}' + r'p.WEB.\w+.\w+.\d.\d' + f'{group}.mp4'
         elif self.season.num and self.date:
             date_str = datetime.strftime(self.date, '%Y-%m-%d')
-            return f'{self.season.get_normalized_name()}.S{self.season.num:02d}.{date_str}.' \
-                   f'{self.get_normalized_title()}.' + r'\d{2,4}' + r'p.WEB.\w+.\w+.\d.\d' + f'{group}.mp4'
+            return f'{self.season.normalized_name}.S{self.season.num:02d}.{date_str}.' \
+                   f'{self.normalized_title}.' + r'\d{2,4}' + r'p.WEB.\w+.\w+.\d.\d' + f'{group}.mp4'
         else:
-            return f'{self.season.get_normalized_name()}.{self.additional_group}.' \
-                   f'{self.get_normalized_title()}.' + r'\d{2,4}' + r'p.WEB.\w+.\w+.\d.\d' + f'{group}.mp4'
+            return f'{self.season.normalized_name}.{self.additional_group}.' \
+                   f'{self.normalized_title}.' + r'\d{2,4}' + r'p.WEB.\w+.\w+.\d.\d' + f'{group}.mp4'
 
     def populate_attributes_from_file(self, path: str) -> None:
-        self.resolution = get_video_height(path)
-        self.video_codec = get_video_codec(path)
-        self.audio_codec = get_audio_codec(path)
-        self.audio_channels = get_audio_channels(path)
-
-    def __lt__(self, other) -> bool:
-        if self.num and other.num:
-            return self.num < other.num
-        return False
+        self.resolution, self.video_codec, self.audio_codec, self.audio_channels = probe_file(path)
 
 
-def get_video_height(path: str) -> int:
-    """Retrieve the video's height, in pixels, using FFMPEG"""
+def run_command(args: List[str]) -> str:
+    """Run a command and return its decoded, stripped output, without opening a console window on Windows"""
 
-    resolution = subprocess.check_output(['ffprobe', '-v', 'error', '-select_streams', 'v:0', '-show_entries',
-                                          'stream=width,height', '-of', 'csv=p=0', path])
-    return int(str(resolution.strip())[1:-1].split(',')[1])
+    creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+    return subprocess.run(args, capture_output=True, encoding='utf-8', check=True,
+                          creationflags=creationflags).stdout.strip()
 
 
-def get_video_codec(path: str) -> str:
-    """Retrieve the video codec using FFMPEG"""
+def probe_file(path: str) -> Tuple[int, str, str, str]:
+    """Retrieve the video's height in pixels, video codec, audio codec and number of audio channels, using a single
+    FFMPEG probe"""
 
-    return subprocess.check_output(['ffprobe', '-v', 'error', '-select_streams', 'v:0', '-show_entries',
-                                    'stream=codec_name', '-of', 'default=noprint_wrappers=1:nokey=1', path])\
-        .decode().strip()
+    output = run_command(['ffprobe', '-v', 'error', '-show_streams', '-of', 'json', path])
 
+    video_stream = None
+    audio_stream = None
+    for stream in json.loads(output)['streams']:
+        if stream['codec_type'] == 'video' and not video_stream:
+            video_stream = stream
+        elif stream['codec_type'] == 'audio' and not audio_stream:
+            audio_stream = stream
 
-def get_audio_channels(path: str) -> str:
-    """Retrieve the number of audio channels using FFMPEG"""
+    if not video_stream or not audio_stream:
+        raise ValueError(f'Could not find both a video and an audio stream in {path}')
 
-    channel_layout = subprocess.check_output(['ffprobe', '-show_entries', 'stream=channel_layout', '-select_streams',
-                                              'a:0', '-of', 'compact=p=0:nk=1', '-v', '0', path]).decode().strip()
     layouts = {
         'mono': '1.0',
         'stereo': '2.0',
         '5.1(side)': '5.1'
     }
 
+    channel_layout = audio_stream.get('channel_layout')
     if channel_layout not in layouts:
         raise ValueError(f"Unknown audio channel layout {channel_layout}")
 
-    return layouts[channel_layout]
-
-
-def get_audio_codec(path: str) -> str:
-    """Retrieve the audio codec using FFMPEG"""
-
-    return subprocess.check_output(['ffprobe', '-v', 'error', '-select_streams', 'a:0', '-show_entries',
-                                    'stream=codec_name', '-of', 'default=noprint_wrappers=1:nokey=1', path])\
-        .decode().strip().upper()
+    return int(video_stream['height']), video_stream['codec_name'], audio_stream['codec_name'].upper(), \
+        layouts[channel_layout]
 
 
 def dupe_exists(episode: Episode) -> bool:
     """Check if a duplicate copy (any height) of the episode exists in the destination"""
 
-    if not os.path.isdir(episode.season.get_folder_name()):
+    try:
+        entries = os.scandir(episode.season.folder_name)
+    except (FileNotFoundError, NotADirectoryError):
         return False
 
-    for file in os.listdir(episode.season.get_folder_name()):
-        if re.search(episode.get_dupe_check_regex(), file):
-            return True
-
-    return False
+    dupe_check_pattern = re.compile(episode.dupe_check_regex)
+    with entries:
+        return any(dupe_check_pattern.search(entry.name) for entry in entries if entry.is_file())
 
 
-def get_episode(episode: Episode) -> None:
-    """Fetch an individual episode"""
+def get_episode(episode: Episode, video_url_future: Future) -> None:
+    """Fetch an individual episode, once its video URL has been resolved"""
 
-    temp_path = f'{episode.season.get_folder_name()}{os.sep}temp.mp4'
+    folder_name = episode.season.folder_name
+    temp_path = f'{folder_name}{os.sep}temp.mp4'
 
     # delete existing temp/unfinished files in the destination folder
     if os.path.exists(temp_path):
@@ -277,6 +337,7 @@ def get_episode(episode: Episode) -> None:
     if os.path.exists(f'{temp_path}.part'):
         os.remove(f'{temp_path}.part')
 
+    # checked again here, as an earlier episode in the season may have been saved under the same name
     if dupe_exists(episode):
         print(f"Duplicate exists, skipping '{episode.get_filename()}'")
         return
@@ -284,43 +345,67 @@ def get_episode(episode: Episode) -> None:
     print(f'Starting {episode.get_filename()} ...')
 
     try:
-        video_url = episode.get_video_url()
+        video_url = video_url_future.result()
     except VideoError as e:
         print(f'Error: {e.error_msg}')
         return
 
-    subprocess.run(["youtube-dl", f'-o{temp_path}', video_url])
+    # the output template is fixed when YoutubeDL is constructed, so each episode gets its own instance
+    try:
+        with YoutubeDL({'outtmpl': temp_path}) as ydl:
+            ydl.download([video_url])
+    except DownloadError:
+        return  # yt-dlp has already reported the error
+
     episode.populate_attributes_from_file(temp_path)
 
-    final_path = f'{episode.season.get_folder_name()}{os.sep}{episode.get_filename()}'
+    final_path = f'{folder_name}{os.sep}{episode.get_filename()}'
 
     rename_file(temp_path, final_path)
 
 
-def get_season(url) -> None:
-    """Fetch a season"""
+def get_season(season_future: Future) -> None:
+    """Fetch a season, once its catalog page has been parsed"""
 
     try:
-        curr_season = Season(url)
+        curr_season = season_future.result()
     except VideoError as e:
         print(e.error_msg)
         return
 
+    pending_episodes = []
     for curr_episode in curr_season.episodes:
-        get_episode(curr_episode)
+        if dupe_exists(curr_episode):
+            print(f"Duplicate exists, skipping '{curr_episode.get_filename()}'")
+        else:
+            pending_episodes.append(curr_episode)
+
+    # resolve video URLs concurrently, but download one episode at a time. Only the next few URLs are resolved ahead
+    # of the download, as they are signed and short-lived.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        video_url_futures = {}
+        for i, curr_episode in enumerate(pending_episodes):
+            for upcoming_episode in pending_episodes[i:i + MAX_WORKERS]:
+                if upcoming_episode not in video_url_futures:
+                    video_url_futures[upcoming_episode] = executor.submit(upcoming_episode.get_video_url)
+
+            get_episode(curr_episode, video_url_futures.pop(curr_episode))
 
 
 def get_show(show: Show) -> None:
     """Fetch a show"""
 
-    # Fetch regular seasons
-    for curr_season_num in show.seasons:
-        curr_url = f'https://watch.opb.org/show/{show.show_key}/episodes/season/{curr_season_num}/'
-        get_season(curr_url)
-
-    # Fetch specials, extras
+    # Regular seasons, then specials and extras
+    season_urls = [f'https://watch.opb.org/show/{show.show_key}/episodes/season/{curr_season_num}/'
+                   for curr_season_num in show.seasons]
     if show.has_specials:
-        get_season(f'https://watch.opb.org/show/{show.show_key}/specials/')
+        season_urls.append(f'https://watch.opb.org/show/{show.show_key}/specials/')
+
+    # crawl the season catalog pages concurrently, but fetch one season at a time
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        season_futures = [executor.submit(Season, season_url) for season_url in season_urls]
+        for season_future in season_futures:
+            get_season(season_future)
 
 
 @retry(PermissionError, delay=1, tries=5)
@@ -336,7 +421,7 @@ def check_dependencies() -> None:
     if sys.version_info < (3, 8):
         raise ValueError('Required: Python 3.8 or later')
 
-    binaries = ['youtube-dl', 'ffprobe']
+    binaries = ['ffprobe']
 
     for binary in binaries:
         if not shutil.which(binary):
@@ -350,10 +435,16 @@ if __name__ == '__main__':
     argparser = argparse.ArgumentParser()
     argparser.add_argument('show-key')
     argparser.add_argument('--group', help='Add a release group to file/folder names')
+    argparser.add_argument('--no-cache', action='store_true', help='Clear cached pages and fetch everything again')
 
     args = argparser.parse_args()
 
     GROUP = args.group
+    SESSION = create_session()
+
+    # drop all cached pages, so everything is fetched again and the fresh copies are cached for the next run
+    if args.no_cache:
+        SESSION.cache.clear()
 
     try:
         curr_show = Show(vars(args)['show-key'])